@@ -1,6 +1,6 @@
 """
 SEO Agent System
 """
-from .root_agent import root_agent
+from .root_agent import root_agent, app
 
-__all__ = ['root_agent']
+__all__ = ['root_agent', 'app']
@@ -0,0 +1,48 @@
+"""
+Turn ADK runner events into chat text.
+"""
+import logging
+from typing import Any, AsyncIterable, AsyncIterator, List
+
+logger = logging.getLogger(__name__)
+
+
+def event_texts(event: Any) -> List[str]:
+    """Non-empty text parts of an event, in order"""
+    content = getattr(event, "content", None)
+    parts = getattr(content, "parts", None) or ()
+    return [text for part in parts if (text := getattr(part, "text", None))]
+
+
+async def stream_text(events: AsyncIterable[Any]) -> AsyncIterator[str]:
+    """
+    Yield response text from runner.run_async events as it arrives.
+
+    Partial (SSE) chunks are yielded as they stream in; the final event of a
+    streamed response repeats the full text and is skipped. Consecutive model
+    responses are separated by a blank line.
+    """
+    separator = ""      # Blank line between consecutive model responses
+    streamed = False    # Partial chunks already yielded for the current response
+    produced = False
+    async for event in events:
+        usage = getattr(event, "usage_metadata", None)
+        if usage and usage.cached_content_token_count:
+            logger.info("Context cache hit: %d cached tokens", usage.cached_content_token_count)
+
+        texts = event_texts(event)
+        if getattr(event, "partial", False):
+            for text in texts:
+                yield separator + text
+                separator = ""
+                streamed = produced = True
+        else:
+            if texts and not streamed:
+                yield separator + "\n".join(texts)
+                produced = True
+            if texts or streamed:
+                separator = "\n\n"
+            streamed = False
+
+    if not produced:
+        yield "No response generated"
@@ -1,6 +1,12 @@
 """
 Root SEO Agent - Coordinator
 """
-from .agent import root_agent
+from pathlib import Path
+from dotenv import load_dotenv
 
-__all__ = ['root_agent']
+# Load .env once for the root agent and every sub-agent (before they are imported)
+load_dotenv(dotenv_path=Path(__file__).parents[2] / ".env")
+
+from .agent import root_agent, app
+
+__all__ = ['root_agent', 'app']
@@ -1,8 +1,16 @@
-from google.genai import types
-from google.adk.agents import LlmAgent
+from typing import AsyncGenerator, Optional
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.apps import App
+from google.adk.events import Event
 import logging
+import re
 
 # Import from subagent package
+from .subagent._cache import TTLCache, begin_turn, end_turn
+from .subagent._config import TERSE_CFG
+from .subagent._prompts import ROUTER_INSTRUCTION
 from .subagent import (
     technical_seo_agent,
     keyword_agent,
@@ -13,27 +21,12 @@ from .subagent import (
 
 logger = logging.getLogger(__name__)
 
-# ✅ CRITICAL: Explicit audit → technical_seo_agent mapping
-system_instruction = """You coordinate SEO tasks for GSBG.IN by routing to specialist agents.
-
-ROUTING RULES (Match FIRST rule that applies):
-
-1. "audit" OR "technical audit" OR "technical SEO" → transfer_to_agent(agent_name="technical_seo_agent")
-2. "keyword" OR "keyword research" OR "research" → transfer_to_agent(agent_name="keyword_agent")
-3. "content" OR "analyze page" OR "page analysis" → transfer_to_agent(agent_name="content_agent")
-4. "performance" OR "check" OR "monitor" OR "traffic" → transfer_to_agent(agent_name="performance_agent")
-5. "report" OR "comprehensive" OR "summary" → transfer_to_agent(agent_name="reporting_agent")
-
-CRITICAL:
-- "audit" ALWAYS = technical_seo_agent (NOT reporting_agent)
-- Do NOT explain, do NOT acknowledge
-- ONLY call transfer_to_agent() immediately"""
-
-root_agent = LlmAgent(
-    name="root_agent",
-    model="gemini-2.0-flash-exp",  # Keep your working model
-    description="SEO Coordinator for GSBG.IN that routes requests to specialist agents",
-    instruction=system_instruction,
+# LLM fallback: only consulted when the keyword router finds no (or an ambiguous) match
+llm_router = LlmAgent(
+    name="llm_router",
+    model="gemini-2.5-flash-lite",  # ✅ Cheapest tier: routing needs no analysis
+    description="Fallback SEO Coordinator for GSBG.IN requests the keyword router cannot place",
+    instruction=ROUTER_INSTRUCTION,
     sub_agents=[
         technical_seo_agent,
         keyword_agent,
@@ -41,11 +34,96 @@ root_agent = LlmAgent(
         performance_agent,
         reporting_agent
     ],
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.0,  # ✅ Zero for deterministic routing
-        top_p=0.9,
-        max_output_tokens=256,
-    )
+    generate_content_config=TERSE_CFG,  # ✅ Deterministic routing, capped output
+)
+
+# Same keyword rules as ROUTER_INSTRUCTION
+_ROUTES = (
+    ("technical_seo_agent", r"audits?|technical"),
+    ("keyword_agent", r"keywords?|research"),
+    ("content_agent", r"content|analy[sz]e page|page analysis"),
+    ("performance_agent", r"performance|check|monitor|traffic"),
+    ("reporting_agent", r"reports?|comprehensive|summary"),
 )
+_ROUTE_RE = re.compile(
+    r"\b(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in _ROUTES) + r")\b",
+    re.IGNORECASE,
+)
+
+
+def match_route(message: str) -> Optional[str]:
+    """
+    Return the specialist agent name when the message's keywords point at exactly one agent.
+
+    None means no rule matched or the keywords name several specialists; both go to the LLM.
+    """
+    matched = {m.lastgroup for m in _ROUTE_RE.finditer(message)}
+    return matched.pop() if len(matched) == 1 else None
+
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# normalized query -> agent name chosen by llm_router (routing rules are stable)
+_route_cache = TTLCache(ttl=24 * 3600, maxsize=1024)
 
-logger.info("✅ Root SEO Agent initialized with 5 specialist sub-agents")
+
+def normalize_query(message: str) -> str:
+    """Casefold, drop punctuation and collapse whitespace"""
+    return " ".join(_PUNCT_RE.sub("", message.casefold()).split())
+
+
+class RoutingAgent(BaseAgent):
+    """Deterministic keyword router that only falls back to the LLM when no single rule matches"""
+
+    fallback: LlmAgent
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        parts = ctx.user_content.parts if ctx.user_content and ctx.user_content.parts else []
+        message = " ".join(part.text for part in parts if part.text)
+        target = match_route(message)
+        query_key = None
+        if target is None:
+            query_key = normalize_query(message)
+            target = _route_cache.get(query_key)
+        agent = self.find_agent(target) if target else None
+
+        if agent is None:
+            agent = self.fallback
+        logger.info("Routing to %s", agent.name)
+
+        # Remember the LLM's decision so the same phrasing skips it next time.
+        # Only the router's first transfer counts: later ones are made by the
+        # specialist (to a peer or back to the router) and are not routes.
+        record_route = agent is self.fallback and query_key is not None
+        async for event in agent.run_async(ctx):
+            transfer = event.actions.transfer_to_agent
+            if record_route and transfer and event.author == self.fallback.name:
+                if transfer != self.fallback.name:
+                    _route_cache.set(query_key, transfer)
+                record_route = False
+            yield event
+
+
+root_agent = RoutingAgent(
+    name="root_agent",
+    description="SEO Coordinator for GSBG.IN that routes requests to specialist agents",
+    fallback=llm_router,
+    sub_agents=[llm_router],
+    # Turn-local tool cache: sub-agents share crawl results within one user turn
+    before_agent_callback=begin_turn,
+    after_agent_callback=end_turn,
+)
+
+# ✅ Gemini context caching: the static instruction + tool schema prefix of
+# every agent is registered once via cachedContents and reused by cache name.
+# ADK refreshes the cache before the TTL runs out and skips prefixes below
+# Gemini's 2048-token minimum.
+app = App(
+    name="seo_agent_app",
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        min_tokens=2048,
+        ttl_seconds=1800,
+        cache_intervals=10,
+    ),
+)
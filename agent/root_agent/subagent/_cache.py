@@ -0,0 +1,203 @@
+"""
+Response caches shared by the sub-agent tool wrappers.
+"""
+import asyncio
+import contextvars
+import functools
+import inspect
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire `ttl` seconds after insertion."""
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def values(self) -> list:
+        """Snapshot of the values that have not expired yet."""
+        now = time.monotonic()
+        with self._lock:
+            return [value for expires, value in self._data.values() if expires >= now]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (expires, _) in self._data.items() if expires < now]:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._data[next(iter(self._data))]
+
+
+def _vectorize(text: str) -> Tuple[Counter, float]:
+    """Bag-of-words vector and its L2 norm."""
+    vec = Counter(_TOKEN_RE.findall(text))
+    return vec, math.sqrt(sum(n * n for n in vec.values()))
+
+
+def _cosine(a: Tuple[Counter, float], b: Tuple[Counter, float]) -> float:
+    (va, na), (vb, nb) = a, b
+    if not na or not nb:
+        return 0.0
+    if len(va) > len(vb):
+        va, vb = vb, va
+    return sum(n * vb[token] for token, n in va.items()) / (na * nb)
+
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, str) and result.startswith("❌")
+
+
+def _bound_arguments(signature: inspect.Signature, args: tuple, kwargs: dict) -> tuple:
+    """Argument values in signature order, so positional and keyword calls match"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return tuple(bound.arguments.values())
+
+
+def semantic_cache(ttl: float = 1800, threshold: Optional[float] = 0.92, maxsize: int = 256):
+    """
+    Memoize a tool wrapper on its normalized arguments.
+
+    Arguments are bound against the signature (so positional and keyword calls
+    share entries), stripped and lowercased. On an exact miss, the closest
+    cached key by bag-of-words cosine similarity is reused when it scores at
+    least `threshold`; pass `threshold=None` for exact matching only.
+    Error responses (starting with ❌) are never cached.
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(fn)
+        cache = TTLCache(ttl, maxsize)
+
+        def make_key(args, kwargs) -> str:
+            return "|".join(
+                "" if value is None else str(value).strip().lower()
+                for value in _bound_arguments(signature, args, kwargs)
+            )
+
+        def lookup(key: str) -> Optional[Tuple[Any, Any]]:
+            entry = cache.get(key)
+            if entry is None and threshold is not None:
+                vec = _vectorize(key)
+                scored = ((_cosine(vec, e[0]), e) for e in cache.values())
+                score, best = max(scored, key=lambda s: s[0], default=(0.0, None))
+                if score >= threshold:
+                    entry = best
+            return entry
+
+        def store(key: str, result: Any) -> None:
+            if not _is_error(result):
+                cache.set(key, (_vectorize(key), result))
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                entry = lookup(key)
+                if entry is not None:
+                    return entry[1]
+                result = await fn(*args, **kwargs)
+                store(key, result)
+                return result
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                entry = lookup(key)
+                if entry is not None:
+                    return entry[1]
+                result = fn(*args, **kwargs)
+                store(key, result)
+                return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+# ----------------------
+# Turn-local memoization
+# ----------------------
+
+# Invocation id of the user turn being processed. Set by the root agent's
+# before_agent_callback; asyncio tasks and to_thread workers inherit it.
+_current_turn: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("seo_current_turn", default=None)
+
+# invocation id -> {(tool name, args): task}. The TTL only matters for turns
+# that die before after_agent_callback gets to clear them.
+_turn_results = TTLCache(ttl=900, maxsize=64)
+
+
+def begin_turn(callback_context) -> None:
+    """before_agent_callback for the root agent: start a turn-local cache"""
+    _current_turn.set(callback_context.invocation_id)
+    _turn_results.set(callback_context.invocation_id, {})
+
+
+def end_turn(callback_context) -> None:
+    """after_agent_callback for the root agent: drop the turn-local cache"""
+    _turn_results.pop(callback_context.invocation_id)
+    _current_turn.set(None)
+
+
+def turn_local(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Share one result per (tool, arguments) within a single user turn.
+
+    Every sub-agent that calls the decorated async tool during the same turn
+    awaits the same task, including calls that are still in flight. Outside
+    a turn the tool is called directly.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        turn = _current_turn.get()
+        results = _turn_results.get(turn) if turn else None
+        if results is None:
+            return await fn(*args, **kwargs)
+
+        key = (fn.__qualname__, _bound_arguments(signature, args, kwargs))
+        task = results.get(key)
+        if task is None:
+            task = results[key] = asyncio.ensure_future(fn(*args, **kwargs))
+        return await asyncio.shield(task)
+
+    return wrapper
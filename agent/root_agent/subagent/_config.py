@@ -0,0 +1,36 @@
+"""
+Shared generation profiles and tool wrappers for the SEO agents.
+"""
+import functools
+
+from google.adk.tools import FunctionTool
+from google.genai import types
+
+# Routing/status paths: deterministic, narrow nucleus, hard cap on output
+TERSE_CFG = types.GenerateContentConfig(
+    temperature=0.0,
+    top_p=0.1,
+    max_output_tokens=256,
+)
+
+# Analysis paths: full recommendations and reports
+VERBOSE_CFG = types.GenerateContentConfig(
+    temperature=0.7,
+    top_p=0.95,
+    max_output_tokens=8192,
+)
+
+# Call-the-tool-then-summarize paths: low temperature, no extended thinking
+SUMMARY_CFG = types.GenerateContentConfig(
+    temperature=0.2,
+    max_output_tokens=2048,
+    thinking_config=types.ThinkingConfig(thinking_budget=0),
+)
+
+
+class FrozenFunctionTool(FunctionTool):
+    """FunctionTool whose JSON schema declaration is built once, not on every LLM request"""
+
+    @functools.cache
+    def _get_declaration(self):
+        return super()._get_declaration()
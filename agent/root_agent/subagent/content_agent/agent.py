@@ -1,51 +1,55 @@
-from typing import Optional
-from pathlib import Path
-from dotenv import load_dotenv
+from typing import List, Optional
+import asyncio
+import json
 import logging
+import re
+
+from tools.seo_tools import extract_content_data
+
+from .._cache import semantic_cache, turn_local
+from .._config import VERBOSE_CFG, FrozenFunctionTool
+from .._prompts import CONTENT_INSTRUCTION
 
-env_path = Path(__file__).resolve().parents[4] / ".env"
-load_dotenv(dotenv_path=env_path)
 logger = logging.getLogger(__name__)
 
-def analyze_page_content(page_url: str) -> str:
-    """Analyze content for a GSBG.IN page"""
-    from tools.seo_tools import analyze_content
-    
-    if "gsbg.in" not in page_url.lower():
+_GSBG_RE = re.compile(r"gsbg\.in", re.IGNORECASE)
+
+@turn_local
+@semantic_cache(ttl=1800, threshold=None)  # URLs: similar paths are different pages
+async def analyze_page_content(page_url: str) -> str:
+    """Analyze content for a GSBG.IN page; returns compact JSON (title, meta_description, h1s, word_count, score, recommendations)"""
+    if not _GSBG_RE.search(page_url):
         return f"❌ Only analyzes GSBG.IN pages"
     
     try:
-        return analyze_content(page_url)
+        data = await asyncio.to_thread(extract_content_data, page_url)
+        if 'error' in data:
+            return f"❌ Analysis failed: {data['error']}"
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
     except Exception as e:
-        logger.error(f"Content analysis error: {e}")
+        logger.error("Content analysis error: %r", e)
         return f"❌ Analysis failed: {str(e)}"
 
-from google.adk.agents import LlmAgent
-from google.genai import types
+async def analyze_pages_batch(page_urls: List[str], max_concurrent: int = 8) -> List[str]:
+    """Analyze content for several GSBG.IN pages concurrently (results in input order)"""
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
 
-system_instruction = """You are a Content Optimization Specialist for GSBG.IN.
+    async def analyze_one(page_url: str) -> str:
+        async with semaphore:
+            return await analyze_page_content(page_url)
 
-When you receive control:
-1. Call analyze_page_content() immediately
-2. Evaluate meta tags, headings, content quality
-3. Provide optimization recommendations
+    return await asyncio.gather(*(analyze_one(url) for url in page_urls))
 
-Call the analysis function immediately."""
+from google.adk.agents import LlmAgent
 
 # ✅ CORRECT: NO invalid parameters
 content_agent = LlmAgent(
     name="content_agent",
     model="gemini-2.5-flash",
     description="Analyzes page content for GSBG.IN: content quality, meta tags, title/description optimization, heading structure, readability, keyword usage, internal linking, E-E-A-T.",
-    instruction=system_instruction,
-    tools=[analyze_page_content],
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.7,
-        top_p=0.95,
-        max_output_tokens=8192,
-    )
+    instruction=CONTENT_INSTRUCTION,
+    tools=[FrozenFunctionTool(analyze_page_content), FrozenFunctionTool(analyze_pages_batch)],
+    generate_content_config=VERBOSE_CFG,
 )
 
-logger.info("✅ Content Optimization Agent created")
-
 __all__ = ['content_agent']
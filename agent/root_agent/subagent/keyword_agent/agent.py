@@ -1,46 +1,53 @@
-from typing import Optional
-from pathlib import Path
-from dotenv import load_dotenv
+from typing import List, Optional
+import asyncio
 import logging
+import re
+
+from tools.seo_tools import research_keywords
+
+from .._cache import semantic_cache, turn_local
+from .._config import FrozenFunctionTool
+from .._prompts import KEYWORD_INSTRUCTION
 
-env_path = Path(__file__).resolve().parents[4] / ".env"
-load_dotenv(dotenv_path=env_path)
 logger = logging.getLogger(__name__)
 
-def research_keywords_for_gsbg(topic: str, focus_area: Optional[str] = None) -> str:
+_GSBG_RE = re.compile(r"gsbg", re.IGNORECASE)
+
+@turn_local
+@semantic_cache(ttl=1800, threshold=0.92)
+async def research_keywords_for_gsbg(topic: str, focus_area: Optional[str] = None) -> str:
     """Research keywords for GSBG.IN"""
-    from tools.seo_tools import research_keywords
-    
     try:
-        context_topic = f"{topic} for GSBG.IN" if "gsbg" not in topic.lower() else topic
+        context_topic = f"{topic} for GSBG.IN" if not _GSBG_RE.search(topic) else topic
         if focus_area:
             context_topic = f"{context_topic} - {focus_area}"
         
-        return research_keywords(context_topic)
+        return await asyncio.to_thread(research_keywords, context_topic)
         
     except Exception as e:
-        logger.error(f"Keyword research error: {e}")
+        logger.error("Keyword research error: %r", e)
         return f"❌ Research failed: {str(e)}"
 
-from google.adk.agents import LlmAgent
-from google.genai import types
+async def research_keywords_batch(topics: List[str], focus_area: Optional[str] = None, max_concurrent: int = 8) -> List[str]:
+    """Research keywords for several GSBG.IN topics concurrently (results in input order)"""
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
 
-system_instruction = """You are a Keyword Research Specialist for GSBG.IN.
+    async def research_one(topic: str) -> str:
+        async with semaphore:
+            return await research_keywords_for_gsbg(topic, focus_area)
 
-When you receive control:
-1. Call research_keywords_for_gsbg() immediately
-2. Provide categorized keyword lists
-3. Focus on Salesforce consulting keywords
+    return await asyncio.gather(*(research_one(topic) for topic in topics))
 
-Call the research function immediately."""
+from google.adk.agents import LlmAgent
+from google.genai import types
 
 # ✅ CORRECT: NO invalid parameters
 keyword_agent = LlmAgent(
     name="keyword_agent",
     model="gemini-2.5-flash",
     description="Conducts keyword research for GSBG.IN: keyword opportunities, search terms, competitor keywords, rankings, search volume, keyword difficulty, SEO strategy for Salesforce consulting.",
-    instruction=system_instruction,
-    tools=[research_keywords_for_gsbg],
+    instruction=KEYWORD_INSTRUCTION,
+    tools=[FrozenFunctionTool(research_keywords_for_gsbg), FrozenFunctionTool(research_keywords_batch)],
     generate_content_config=types.GenerateContentConfig(
         temperature=0.8,
         top_p=0.95,
@@ -48,6 +55,4 @@ keyword_agent = LlmAgent(
     )
 )
 
-logger.info("✅ Keyword Research Agent created")
-
 __all__ = ['keyword_agent']
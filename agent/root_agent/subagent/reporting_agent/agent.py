@@ -1,50 +1,103 @@
-from typing import Optional
-from pathlib import Path
-from dotenv import load_dotenv
+from typing import List, Optional, Tuple
+import asyncio
+import json
 import logging
 
-env_path = Path(__file__).resolve().parents[4] / ".env"
-load_dotenv(dotenv_path=env_path)
+from tools.seo_tools import generate_seo_report
+
+from .._cache import semantic_cache
+from .._config import SUMMARY_CFG, FrozenFunctionTool
+from .._prompts import REPORTING_INSTRUCTION
+from ..content_agent.agent import analyze_page_content
+from ..keyword_agent.agent import research_keywords_for_gsbg
+from ..performance_agent.agent import monitor_gsbg_performance
+from ..technical_seo_agent.agent import perform_technical_audit
+
 logger = logging.getLogger(__name__)
 
+# (label, specialist tool, args) for the prose sections appended to the report
+_DATA_SOURCES = (
+    ("Technical audit", perform_technical_audit, ("gsbg.in",)),
+    ("Keyword research", research_keywords_for_gsbg, ("Salesforce consulting",)),
+    ("Performance check", monitor_gsbg_performance, ("all",)),
+)
+
+# Per-source budget: the audit's homepage fetch alone can take 3 attempts (Retry total=2)
+# of a 10 s timeout plus backoff, and its robots/sitemap probes run alongside it
+_SOURCE_TIMEOUT = 45
+
+# Sections starting with these are errors or timeouts, not data
+_DEGRADED_MARKERS = ("❌", "⚠️")
+
+_SECTION_SEPARATOR = "\n\n---\n\n"
+
+class _IncompleteReport(Exception):
+    """Carries a report with failed or timed-out sections out of the cache, so it is not stored"""
+
+    def __init__(self, report: str):
+        super().__init__(report)
+        self.report = report
+
+async def _fetch_source(label: str, tool, args: tuple) -> str:
+    """Run one data source; a slow source becomes a warning instead of stalling the report"""
+    try:
+        async with asyncio.timeout(_SOURCE_TIMEOUT):
+            return await tool(*args)
+    except TimeoutError:
+        logger.warning("%s timed out after %ss", label, _SOURCE_TIMEOUT)
+        return f"⚠️ {label} timed out after {_SOURCE_TIMEOUT}s"
+
+async def _build_overview() -> Tuple[str, bool]:
+    """Report overview with the content section built from structured homepage data, and whether that data was available"""
+    content = await _fetch_source("Content analysis", analyze_page_content, ("https://www.gsbg.in",))
+    try:
+        content_data = json.loads(content)
+    except ValueError:
+        # Error/timeout messages are plain text; fall back to the generic section
+        content_data = None
+    overview = await asyncio.to_thread(generate_seo_report, "gsbg.in", content_data)
+    return overview, content_data is not None
+
+async def _gather_seo_data() -> List[str]:
+    """Fetch all report data sources concurrently (wall time = slowest source)"""
+    # Structured concurrency: an unexpected failure cancels the sibling fetches
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_fetch_source(*source)) for source in _DATA_SOURCES]
+    return [task.result() for task in tasks]
+
+@semantic_cache(ttl=1800, threshold=None)
+async def _compile_report() -> str:
+    """Full report; raises _IncompleteReport instead of returning (and caching) a degraded one"""
+    async with asyncio.TaskGroup() as tg:
+        overview = tg.create_task(_build_overview())
+        sections = tg.create_task(_gather_seo_data())
+    overview_text, content_ok = overview.result()
+    report = _SECTION_SEPARATOR.join([overview_text, *sections.result()])
+    if not content_ok or any(section.startswith(_DEGRADED_MARKERS) for section in sections.result()):
+        raise _IncompleteReport(report)
+    return report
+
 # ✅ CRITICAL: Function signature must match what's in tools/seo_tools.py
-def generate_gsbg_report() -> str:
-    """Generate comprehensive SEO report for GSBG.IN"""
-    from tools.seo_tools import generate_seo_report
-    
+async def generate_gsbg_report() -> str:
+    """Generate comprehensive SEO report for GSBG.IN from audit, keyword, content and performance data"""
     try:
-        # Call the actual tool function - check its signature!
-        return generate_seo_report("gsbg.in")
+        return await _compile_report()
+    except _IncompleteReport as e:
+        return e.report
     except Exception as e:
-        logger.error(f"Report generation error: {e}")
+        logger.error("Report generation error: %r", e)
         return f"❌ Report generation failed: {str(e)}"
 
 from google.adk.agents import LlmAgent
-from google.genai import types
-
-system_instruction = """You are an SEO Reporting Specialist for GSBG.IN.
-
-When you receive control:
-1. Call generate_gsbg_report() immediately
-2. Provide executive summary
-3. Create prioritized action plan
-
-Call the report function immediately."""
 
 # ✅ CORRECT: NO invalid parameters
 reporting_agent = LlmAgent(
     name="reporting_agent",
-    model="gemini-2.5-flash",
+    model="gemini-2.5-flash-lite",
     description="Generates comprehensive SEO REPORTS for GSBG.IN: full reports, executive summaries, progress tracking, actionable recommendations, prioritized plans. This agent generates REPORTS, not audits.",
-    instruction=system_instruction,
-    tools=[generate_gsbg_report],
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.7,
-        top_p=0.95,
-        max_output_tokens=8192,
-    )
+    instruction=REPORTING_INSTRUCTION,
+    tools=[FrozenFunctionTool(generate_gsbg_report)],
+    generate_content_config=SUMMARY_CFG,
 )
 
-logger.info("✅ Reporting Agent created")
-
 __all__ = ['reporting_agent']
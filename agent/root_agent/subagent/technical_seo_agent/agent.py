@@ -1,52 +1,46 @@
 from typing import Optional
-from pathlib import Path
-from dotenv import load_dotenv
+import asyncio
 import logging
+import re
 from google.adk.agents import LlmAgent
-from google.genai import types
+from tools.seo_tools import audit_technical_seo
+
+from .._cache import semantic_cache, turn_local
+from .._config import SUMMARY_CFG, FrozenFunctionTool
+from .._prompts import TECHNICAL_SEO_INSTRUCTION
 
-env_path = Path(__file__).resolve().parents[4] / ".env"
-load_dotenv(dotenv_path=env_path)
 logger = logging.getLogger(__name__)
 
-def perform_technical_audit(domain: str = "gsbg.in") -> str:
-    """Performs technical SEO audit for gsbg.in"""
-    from tools.seo_tools import audit_technical_seo
-    
-    domain_clean = domain.lower().replace('https://', '').replace('http://', '').replace('www.', '').strip('/')
-    
-    if domain_clean != "gsbg.in":
-        return f"❌ Only works with gsbg.in"
-    
+_SCHEME_WWW_RE = re.compile(r'^(?:https?://)?(?:www\.)?', re.I)
+_ALLOWED_DOMAINS = frozenset({"gsbg.in"})
+
+@turn_local
+@semantic_cache(ttl=900, threshold=None)
+async def _audit_domain(domain_clean: str) -> str:
+    """Audit an allowed domain; cached on the normalized name, so every spelling shares one crawl"""
     try:
-        return audit_technical_seo("https://www.gsbg.in")
+        return await asyncio.to_thread(audit_technical_seo, f"https://www.{domain_clean}")
     except Exception as e:
-        logger.error(f"Audit failed: {str(e)}")
+        logger.error("Audit failed: %r", e)
         return f"❌ Audit failed: {str(e)}"
 
-system_instruction = """You are the Technical SEO Audit Specialist for GSBG.IN.
-
-When you receive control:
-1. Immediately call perform_technical_audit()
-2. Analyze results and provide recommendations
-3. Use ✅ ❌ ⚠️ indicators
-
-Call the audit function immediately - no questions."""
+async def perform_technical_audit(domain: str = "gsbg.in") -> str:
+    """Performs technical SEO audit for gsbg.in"""
+    domain_clean = _SCHEME_WWW_RE.sub('', domain.strip()).rstrip('/').lower()
+    
+    if domain_clean not in _ALLOWED_DOMAINS:
+        return f"❌ Only works with gsbg.in"
+    
+    return await _audit_domain(domain_clean)
 
 # ✅ CORRECT: NO invalid parameters
 technical_seo_agent = LlmAgent(
     name="technical_seo_agent",
-    model="gemini-2.5-flash",
+    model="gemini-2.5-flash-lite",
     description="Performs technical SEO AUDITS for gsbg.in: site audits, technical scans, crawlability, indexing, site speed, Core Web Vitals, mobile testing. This agent performs AUDITS, not reports.",
-    instruction=system_instruction,
-    tools=[perform_technical_audit],
-    generate_content_config=types.GenerateContentConfig(
-        temperature=0.7,
-        top_p=0.95,
-        max_output_tokens=8192,
-    )
+    instruction=TECHNICAL_SEO_INSTRUCTION,
+    tools=[FrozenFunctionTool(perform_technical_audit)],
+    generate_content_config=SUMMARY_CFG,
 )
 
-logger.info("✅ Technical SEO Agent created")
-
 __all__ = ['technical_seo_agent']
@@ -2,6 +2,11 @@ import streamlit as st
 import os
 import logging
 import asyncio
+import itertools
+import queue
+import threading
+from collections import deque
+from contextlib import aclosing
 from datetime import datetime
 from dotenv import load_dotenv
 import uuid
@@ -9,7 +14,9 @@ import uuid
 st.set_page_config(page_title="SEO Management Agent", page_icon="🔍", layout="wide", initial_sidebar_state="expanded")
 
 load_dotenv()
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+if __name__ == "__main__":
+    # Only configure the root logger when run as the app, not when imported
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper(), format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
@@ -20,19 +27,85 @@ if not api_key:
 else:
     os.environ["GOOGLE_API_KEY"] = api_key
 
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
-from agent.root_agent.agent import root_agent
+from agent._streaming import event_texts, stream_text
+from agent.root_agent.agent import app
+
+# Chat messages kept for rendering, and session events replayed to the model per turn
+MAX_CHAT_MESSAGES = 50
+MAX_SESSION_EVENTS = 30
+
+# Sidebar quick actions: (button label, prompt sent to the agent), rendered two per row.
+# Report runs every analysis concurrently in one turn, instead of one turn per button.
+QUICK_ACTIONS = (
+    ("🔍 Audit", "Audit gsbg.in"),
+    ("🔑 Keywords", "Research keywords for Salesforce consulting"),
+    ("📝 Content", "Analyze content at https://www.gsbg.in/services"),
+    ("📈 Performance", "Check GSBG.IN performance"),
+    ("📊 Report", "Generate comprehensive SEO report for gsbg.in"),
+)
+
+class TrimmedHistoryMixin:
+    """Session service mixin that hands the runner only the most recent events"""
+    
+    max_events = MAX_SESSION_EVENTS
+    
+    async def get_session(self, *, app_name, user_id, session_id, config=None):
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session and len(session.events) > self.max_events:
+            events = session.events[-self.max_events:]
+            # Start on a user message so no tool call is cut off from its response
+            start = next((i for i, event in enumerate(events) if event.author == "user"), 0)
+            session.events = events[start:]
+        return session
+
+class TrimmedSessionService(TrimmedHistoryMixin, InMemorySessionService):
+    """In-memory sessions with trimmed history"""
+
+@st.cache_resource
+def get_session_service():
+    """One session store per server process, shared across reruns and browser reloads"""
+    db_url = os.getenv("SESSION_DB_URL")
+    if db_url:
+        # ✅ Persistent store (e.g. sqlite+aiosqlite:///sessions.db) survives server restarts;
+        # needs an async driver (google-adk[db] and aiosqlite in requirements.txt)
+        from google.adk.sessions import DatabaseSessionService
+        
+        class TrimmedDatabaseSessionService(TrimmedHistoryMixin, DatabaseSessionService):
+            """Database-backed sessions with trimmed history"""
+        
+        logger.info("✅ Using database session store")
+        return TrimmedDatabaseSessionService(db_url=db_url)
+    return TrimmedSessionService()
+
+def history_from_events(events):
+    """Rebuild chat messages from a resumed session's events"""
+    messages = deque(maxlen=MAX_CHAT_MESSAGES)
+    for event in events:
+        if getattr(event, 'partial', False):
+            continue
+        text = "\n".join(event_texts(event))
+        if text:
+            role = "user" if event.author == "user" else "assistant"
+            messages.append({"role": role, "content": text})
+    return messages
 
 # ✅ CORRECT: Async helper to create session
 async def create_session_async(session_service, app_name, user_id):
     """Create a new session with proper await"""
     return await session_service.create_session(app_name=app_name, user_id=user_id)
 
-# ✅ CORRECT: Async function to run agent
+# ✅ Stream partial model output (SSE) so text renders while it is generated
+STREAMING_RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE)
+
+# ✅ CORRECT: Async generator that streams the agent's response text
 async def run_agent_async(runner, user_id, session_id, prompt):
-    """Run agent and collect all response events"""
+    """Run agent and yield response text chunks as they arrive"""
     try:
         result_generator = runner.run_async(
             user_id=user_id,
@@ -40,56 +113,98 @@ async def run_agent_async(runner, user_id, session_id, prompt):
             new_message=types.Content(
                 role='user',
                 parts=[types.Part(text=prompt)]
-            )
+            ),
+            run_config=STREAMING_RUN_CONFIG
         )
         
-        # Collect all events
-        response_parts = []
-        async for event in result_generator:
-            if hasattr(event, 'content') and event.content:
-                if hasattr(event.content, 'parts'):
-                    for part in event.content.parts:
-                        if hasattr(part, 'text') and part.text:
-                            response_parts.append(part.text)
-        
-        return "\n".join(response_parts) if response_parts else "No response generated"
+        async with aclosing(stream_text(result_generator)) as chunks:
+            async for chunk in chunks:
+                yield chunk
         
     except Exception as e:
-        logger.error(f"Agent execution error: {e}", exc_info=True)
+        logger.error("Agent execution error: %r", e)
         raise
 
+@st.cache_resource
+def get_event_loop():
+    """One event loop for the whole process, running forever on a daemon thread"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="adk-event-loop", daemon=True).start()
+    return loop
+
+def run_coroutine(coro):
+    """Run a coroutine on the background loop and block until it finishes"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+def sync_stream(agen):
+    """Bridge an async generator to the sync iterator st.write_stream expects"""
+    chunks = queue.Queue()
+    done = object()
+    
+    async def pump():
+        try:
+            async with aclosing(agen):
+                async for chunk in agen:
+                    chunks.put(chunk)
+        finally:
+            chunks.put(done)
+    
+    # ✅ The agent runs on the background loop; this script thread only drains the queue
+    future = asyncio.run_coroutine_threadsafe(pump(), get_event_loop())
+    try:
+        while (chunk := chunks.get()) is not done:
+            yield chunk
+        future.result()  # Re-raise agent errors in the script thread
+    finally:
+        future.cancel()  # Script stopped mid-stream (rerun, reset, closed tab)
+
 def initialize_session_state():
     """Initialize all session state variables"""
     if "app_name" not in st.session_state:
-        st.session_state.app_name = "seo_agent_app"
+        st.session_state.app_name = app.name
     
     if "user_id" not in st.session_state:
-        st.session_state.user_id = f"user_{uuid.uuid4().hex[:8]}"
+        # ✅ Kept in the URL so a browser reload reconnects to the same session
+        st.session_state.user_id = st.query_params.get("uid") or f"user_{uuid.uuid4().hex[:8]}"
+        st.query_params["uid"] = st.session_state.user_id
     
     if "session_service" not in st.session_state:
-        st.session_state.session_service = InMemorySessionService()
+        st.session_state.session_service = get_session_service()
         logger.info("✅ Session service initialized")
     
     if "session" not in st.session_state:
-        # ✅ CRITICAL: Properly await the async create_session
-        session = asyncio.run(
-            create_session_async(
-                st.session_state.session_service,
-                st.session_state.app_name,
-                st.session_state.user_id
+        session = None
+        if sid := st.query_params.get("sid"):
+            session = run_coroutine(
+                st.session_state.session_service.get_session(
+                    app_name=st.session_state.app_name,
+                    user_id=st.session_state.user_id,
+                    session_id=sid
+                )
             )
-        )
+        if session is not None:
+            st.session_state.messages = history_from_events(session.events)
+            logger.info("✅ Session resumed: %s", session.id)
+        else:
+            # ✅ CRITICAL: Properly await the async create_session
+            session = run_coroutine(
+                create_session_async(
+                    st.session_state.session_service,
+                    st.session_state.app_name,
+                    st.session_state.user_id
+                )
+            )
+            st.query_params["sid"] = session.id
+            logger.info("✅ Session created: %s", session.id)
         st.session_state.session = session
-        logger.info(f"✅ Session created: {session.id}")
     
     if "messages" not in st.session_state:
-        st.session_state.messages = []
+        st.session_state.messages = deque(maxlen=MAX_CHAT_MESSAGES)
         logger.info("✅ Message history initialized")
     
     if "runner" not in st.session_state:
         st.session_state.runner = Runner(
-            agent=root_agent,
-            app_name=st.session_state.app_name,
+            app=app,
             session_service=st.session_state.session_service
         )
         logger.info("✅ Runner initialized with root agent")
@@ -122,8 +237,8 @@ What would you like to work on today?
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
     
-    # Chat input
-    if prompt := st.chat_input("Enter your SEO request..."):
+    # Chat input (or a quick action queued by the sidebar on the previous run)
+    if prompt := st.chat_input("Enter your SEO request...") or st.session_state.pop("quick_action", None):
         # Add user message to history
         st.session_state.messages.append({"role": "user", "content": prompt})
         with st.chat_message("user"):
@@ -133,19 +248,18 @@ What would you like to work on today?
         with st.chat_message("assistant"):
             with st.spinner("Processing your request..."):
                 try:
-                    # ✅ CORRECT: Run agent with existing session
-                    response_text = asyncio.run(
-                        run_agent_async(
-                            st.session_state.runner,
-                            st.session_state.user_id,
-                            st.session_state.session.id,
-                            prompt
+                    # ✅ CORRECT: Run agent with existing session, rendering chunks as they stream in
+                    response_text = st.write_stream(
+                        sync_stream(
+                            run_agent_async(
+                                st.session_state.runner,
+                                st.session_state.user_id,
+                                st.session_state.session.id,
+                                prompt
+                            )
                         )
                     )
                     
-                    # Display response
-                    st.markdown(response_text)
-                    
                     # Add to history
                     st.session_state.messages.append({
                         "role": "assistant",
@@ -157,7 +271,7 @@ What would you like to work on today?
                 except Exception as e:
                     error_msg = f"❌ Error: {str(e)}"
                     st.error(error_msg)
-                    logger.error(f"Request failed: {e}", exc_info=True)
+                    logger.error("Request failed: %s", e, exc_info=True)
     
     # Sidebar
     with st.sidebar:
@@ -168,13 +282,25 @@ What would you like to work on today?
         
         st.divider()
         
+        st.header("⚡ Quick Actions")
+        rows = (len(QUICK_ACTIONS) + 1) // 2
+        columns = itertools.chain.from_iterable(st.columns(2) for _ in range(rows))
+        for (label, action_prompt), col in zip(QUICK_ACTIONS, columns):
+            with col:
+                if st.button(label, use_container_width=True, key=f"quick_{label}"):
+                    st.session_state.quick_action = action_prompt
+                    st.rerun()
+        
+        st.divider()
+        
         if st.button("🔄 Clear Chat History", type="secondary"):
-            st.session_state.messages = []
+            st.session_state.messages = deque(maxlen=MAX_CHAT_MESSAGES)
             st.rerun()
         
         if st.button("🔴 Reset Session", type="primary"):
             for key in list(st.session_state.keys()):
                 del st.session_state[key]
+            st.query_params.clear()
             st.rerun()
 
 if __name__ == "__main__":
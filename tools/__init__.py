@@ -3,16 +3,20 @@ SEO Tools Package
 """
 from .seo_tools import (
     audit_technical_seo,
+    audit_technical_seo_bulk,
     research_keywords,
     analyze_content,
+    extract_content_data,
     check_performance,
     generate_seo_report
 )
 
 __all__ = [
     'audit_technical_seo',
+    'audit_technical_seo_bulk',
     'research_keywords',
     'analyze_content',
+    'extract_content_data',
     'check_performance',
     'generate_seo_report'
 ]
@@ -6,15 +6,328 @@ All SEO tools as simple Python functions (Google ADK compatible).
 """
 
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Any, List, Optional  # ⚠️ MISSING: Added Optional
-from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple  # ⚠️ MISSING: Added Optional
+from urllib.robotparser import RobotFileParser
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import logging
+import os
+import re
+import sqlite3
+import threading
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-based lxml parser; fall back to the pure-Python one if lxml is missing
+try:
+    from lxml import html as lxml_html
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    lxml_html = None
+    _HTML_PARSER = 'html.parser'
 
+# The audit only reads these tags, so the parser builds no other nodes
+_AUDIT_STRAINER = SoupStrainer(['title', 'meta', 'h1'])
+
+
+def _parse_html(content: bytes, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse an HTML document with the fastest available parser.
+    
+    CPU-bound: the tools call this from worker threads (the agents wrap them
+    in asyncio.to_thread), never on the event loop.
+    """
+    return BeautifulSoup(content, _HTML_PARSER, parse_only=parse_only)
+
+# One pooled session for every tool: repeat requests to a host reuse its TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; GSBG-SEO-Agent/1.0)'})
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+        # Hand back the last 5xx response instead of raising, so callers report its status
+        raise_on_status=False,
+        # Keep the backoff bounded: a large Retry-After would park the worker thread
+        # long after the caller's timeout has given up on it
+        respect_retry_after_header=False,
+    ),
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# Secondary fetches (robots.txt, sitemap.xml) run here while the caller loads the page
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="seo-fetch")
+
+
+def _fetch_status(url: str, timeout: float) -> Optional[int]:
+    """
+    Status code for url without downloading its body, or None if the request fails.
+    
+    Sends HEAD; servers that refuse it get a streamed GET that is closed unread.
+    """
+    try:
+        status = _SESSION.head(url, timeout=timeout, allow_redirects=True).status_code
+        if status in (405, 501):
+            with _SESSION.get(url, timeout=timeout, stream=True) as response:
+                status = response.status_code
+        return status
+    except Exception:
+        return None
+
+
+class _Page(NamedTuple):
+    status_code: int
+    content: bytes      # Empty for non-HTML responses, truncated at _MAX_PAGE_BYTES
+    content_type: str
+
+
+# Pages fetched within _PAGE_TTL seconds are reused, e.g. the homepage by the audit and the report
+# (url -> (expiry, page))
+_PAGE_TTL = 300
+_PAGE_CACHE_MAX = 64
+_PAGE_CACHE: Dict[str, Tuple[float, _Page]] = {}
+_PAGE_CACHE_LOCK = threading.Lock()
+
+# SEO checks only look at the head and early body; don't buffer huge or hostile pages
+_MAX_PAGE_BYTES = 2_000_000
+
+
+# On-disk validator cache: pages with an ETag/Last-Modified are revalidated with a
+# conditional GET (304 -> stored body) instead of re-downloaded, across restarts too.
+# Kept in a private per-user directory: a shared path would let other users plant pages.
+_PAGE_STORE_DIR = os.environ.get('SEO_TOOLS_CACHE_DIR') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'seo_tools'
+)
+_PAGE_STORE_PATH = os.path.join(_PAGE_STORE_DIR, 'pages.sqlite3')
+_PAGE_STORE_MAX_ROWS = 256
+_PAGE_STORE_LOCK = threading.Lock()
+
+
+@functools.cache
+def _page_store() -> Optional[sqlite3.Connection]:
+    try:
+        os.makedirs(_PAGE_STORE_DIR, mode=0o700, exist_ok=True)
+        conn = sqlite3.connect(_PAGE_STORE_PATH, check_same_thread=False)
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+            'content_type TEXT, content BLOB, stored_at REAL)'
+        )
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Page store disabled: %r", e)
+        return None
+
+
+def _load_stored_page(url: str) -> Optional[Tuple[Optional[str], Optional[str], str, bytes]]:
+    """(etag, last_modified, content_type, content) stored for url, if any"""
+    conn = _page_store()
+    if conn is None:
+        return None
+    try:
+        with _PAGE_STORE_LOCK:
+            return conn.execute(
+                'SELECT etag, last_modified, content_type, content FROM pages WHERE url = ?', (url,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("Page store read failed: %r", e)
+        return None
+
+
+def _store_page(url: str, etag: Optional[str], last_modified: Optional[str], page: _Page) -> None:
+    conn = _page_store()
+    if conn is None:
+        return
+    try:
+        with _PAGE_STORE_LOCK, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)',
+                (url, etag, last_modified, page.content_type, page.content, time.time()),
+            )
+            conn.execute(
+                'DELETE FROM pages WHERE url NOT IN (SELECT url FROM pages ORDER BY stored_at DESC LIMIT ?)',
+                (_PAGE_STORE_MAX_ROWS,),
+            )
+    except sqlite3.Error as e:
+        logger.warning("Page store write failed: %r", e)
+
+
+def _touch_stored_page(url: str) -> None:
+    """Mark a stored page as freshly revalidated, so pruning keeps it"""
+    conn = _page_store()
+    if conn is None:
+        return
+    try:
+        with _PAGE_STORE_LOCK, conn:
+            conn.execute('UPDATE pages SET stored_at = ? WHERE url = ?', (time.time(), url))
+    except sqlite3.Error as e:
+        logger.warning("Page store write failed: %r", e)
+
+
+def _prune_expiring(cache: Dict[str, Tuple[float, Any]], now: float, maxsize: int) -> None:
+    """Drop expired entries, then the oldest ones until there is room for one more (caller holds the lock)"""
+    for key in [k for k, (expires, _) in cache.items() if expires <= now]:
+        del cache[key]
+    while len(cache) >= maxsize:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        del cache[next(iter(cache))]
+
+
+def _download_page(url: str) -> Tuple[_Page, bool]:
+    """GET url (revalidating a stored copy); also returns whether the body is complete"""
+    stored = _load_stored_page(url)
+    headers = {}
+    if stored:
+        if stored[0]:
+            headers['If-None-Match'] = stored[0]
+        if stored[1]:
+            headers['If-Modified-Since'] = stored[1]
+    
+    with _SESSION.get(url, timeout=10, allow_redirects=True, stream=True, headers=headers) as response:
+        if response.status_code == 304 and stored:
+            _touch_stored_page(url)
+            return _Page(200, stored[3], stored[2]), True
+        
+        content_type = response.headers.get('Content-Type', '')
+        if content_type and 'html' not in content_type.lower():
+            return _Page(response.status_code, b'', content_type), True
+        
+        chunks, total = [], 0
+        for chunk in response.iter_content(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= _MAX_PAGE_BYTES:
+                break
+        page = _Page(response.status_code, b''.join(chunks), content_type)
+        complete = total < _MAX_PAGE_BYTES
+        
+        # Only complete pages that the server lets us revalidate are worth storing
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if page.status_code == 200 and complete and (etag or last_modified):
+            _store_page(url, etag, last_modified, page)
+        return page, complete
+
+
+def _fetch_page(url: str) -> _Page:
+    """
+    GET url, memoized for _PAGE_TTL seconds.
+    
+    Only complete 200 responses are cached; errors, non-200 statuses and
+    truncated bodies are fetched again on the next call.
+    """
+    now = time.monotonic()
+    with _PAGE_CACHE_LOCK:
+        cached = _PAGE_CACHE.get(url)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    page, complete = _download_page(url)
+    if page.status_code == 200 and complete:
+        with _PAGE_CACHE_LOCK:
+            _prune_expiring(_PAGE_CACHE, now, _PAGE_CACHE_MAX)
+            _PAGE_CACHE[url] = (now + _PAGE_TTL, page)
+    return page
+
+
+# Parsed robots.txt per site (base URL -> (expiry, rules or None if the site has none))
+_ROBOTS_TTL = 3600
+_ROBOTS_CACHE_MAX = 1024
+_ROBOTS_CACHE: Dict[str, Tuple[float, Optional[RobotFileParser]]] = {}
+_ROBOTS_LOCK = threading.Lock()
+
+
+def _get_robots(base_url: str) -> Optional[RobotFileParser]:
+    """
+    Parsed robots.txt rules for a site, cached for _ROBOTS_TTL seconds.
+    
+    Returns None when the site serves no robots.txt (a 4xx response); fetch
+    errors and server errors (5xx) also return None but are not cached.
+    """
+    now = time.monotonic()
+    with _ROBOTS_LOCK:
+        cached = _ROBOTS_CACHE.get(base_url)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    robots_url = f"{base_url}/robots.txt"
+    try:
+        response = _SESSION.get(robots_url, timeout=5)
+    except Exception as e:
+        logger.warning("robots.txt fetch failed for %s: %r", base_url, e)
+        return None
+    
+    rules = None
+    if response.status_code == 200:
+        rules = RobotFileParser(robots_url)
+        rules.parse(response.text.splitlines())
+    elif not 400 <= response.status_code < 500:
+        # A server error that outlasted the retries says nothing about the file
+        logger.warning("robots.txt fetch failed for %s: status %s", base_url, response.status_code)
+        return None
+    with _ROBOTS_LOCK:
+        _prune_expiring(_ROBOTS_CACHE, now, _ROBOTS_CACHE_MAX)
+        _ROBOTS_CACHE[base_url] = (now + _ROBOTS_TTL, rules)
+    return rules
+
+
+# Visible text nodes: everything except script/style contents (comments are not text())
+_VISIBLE_TEXT_XPATH = '//text()[not(ancestor::script) and not(ancestor::style)]'
+
+
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+def _page_encoding(content: bytes, content_type: str) -> Optional[str]:
+    """
+    Encoding of an HTML body: the Content-Type charset if it decodes the page,
+    else what bs4 sniffs (BOM, <meta charset>, then UTF-8/Windows-1252).
+    """
+    charset = _CHARSET_RE.search(content_type or '')
+    known = [charset.group(1)] if charset else []
+    return UnicodeDammit(content, known_definite_encodings=known, is_html=True).original_encoding
+
+
+def _content_elements(content: bytes, content_type: str = '') -> Tuple[Optional[str], Optional[str], List[str], int]:
+    """
+    Title, meta description, H1 texts and visible word count of an HTML page.
+    
+    Uses lxml's C-level XPath when available, BeautifulSoup otherwise. The body
+    is decoded with _page_encoding, so pages without <meta charset> are not
+    misread as Latin-1.
+    """
+    encoding = _page_encoding(content, content_type)
+    if lxml_html is not None:
+        tree = lxml_html.fromstring(content, parser=lxml_html.HTMLParser(encoding=encoding))
+        title_text = tree.findtext('.//title')
+        meta_desc_text = next(iter(tree.xpath('//meta[@name="description"]/@content')), None)
+        h1_texts = [h1.text_content().strip() for h1 in tree.xpath('//h1')]
+        word_count = sum(len(text.split()) for text in tree.xpath(_VISIBLE_TEXT_XPATH))
+        return title_text, meta_desc_text, h1_texts, word_count
+    
+    soup = BeautifulSoup(content, _HTML_PARSER, from_encoding=encoding)
+    title = soup.find('title')
+    title_text = title.get_text() if title else None
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_desc_text = meta_desc.get('content') if meta_desc else None
+    h1_texts = [h1.get_text().strip() for h1 in soup.find_all('h1')]
+    for script in soup(['script', 'style']):
+        script.decompose()
+    word_count = sum(len(chunk.split()) for chunk in soup.stripped_strings)
+    return title_text, meta_desc_text, h1_texts, word_count
+
+
+# http(s) scheme followed by a non-empty host
+_URL_RE = re.compile(r'^https?://[^\s/?#]+', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
 def validate_url(url: str) -> tuple[bool, str]:
     """
     Validate URL format.
@@ -25,21 +338,29 @@ def validate_url(url: str) -> tuple[bool, str]:
     Returns:
         (is_valid, error_message)
     """
-    try:
-        result = urlparse(url)
-        if all([result.scheme, result.netloc]):
-            return True, ""
-        return False, "Invalid URL format. Must include http:// or https://"
-    except Exception as e:
-        return False, f"URL validation error: {str(e)}"
+    if _URL_RE.match(url):
+        return True, ""
+    return False, "Invalid URL format. Must include http:// or https://"
+
+
+# (result key, label, score weight, detail if passed, detail if failed, priority issue if failed)
+_AUDIT_CHECKS = (
+    ('has_ssl', 'HTTPS/SSL', 20, 'Enabled', 'Not enabled - CRITICAL ISSUE', "🔴 **CRITICAL:** Enable HTTPS/SSL for security and SEO"),
+    ('has_robots_txt', 'robots.txt', 15, 'Found', 'Missing', "🟠 **HIGH:** Create robots.txt to guide search engine crawlers"),
+    ('has_sitemap', 'sitemap.xml', 15, 'Found', 'Missing', "🟠 **HIGH:** Create XML sitemap to help search engines index your site"),
+    ('has_title', 'Title Tag', 20, 'Present', 'Missing', "🔴 **CRITICAL:** Add title tag to homepage"),
+    ('has_meta_description', 'Meta Description', 15, 'Present', 'Missing', None),
+    ('has_h1', 'H1 Tags', 15, '{h1_count} found', '{h1_count} found', None),
+)
 
 
-def audit_technical_seo(domain: str) -> dict:
+def audit_technical_seo(domain: str, probe_pool: Optional[ThreadPoolExecutor] = None) -> dict:
     """
     Perform technical SEO audit on a domain.
     
     Args:
         domain: Domain to audit (e.g., "example.com")
+        probe_pool: Executor for the robots.txt/sitemap.xml probes (defaults to the shared one)
         
     Returns:
         Formatted text report of technical audit results
@@ -54,7 +375,7 @@ def audit_technical_seo(domain: str) -> dict:
         if not is_valid:
             return f"❌ **Technical Audit Failed**\n\nError: {error}"
         
-        logger.info(f"Starting technical audit for {domain}")
+        logger.info("Starting technical audit for %s", domain)
         
         # Initialize results
         results = {
@@ -66,33 +387,23 @@ def audit_technical_seo(domain: str) -> dict:
             'issues': []
         }
         
+        # Check robots.txt and sitemap.xml concurrently with the homepage fetch
+        base = domain.rstrip('/')
+        probe_pool = probe_pool or _FETCH_POOL
+        robots_future = probe_pool.submit(_get_robots, base)
+        sitemap_future = probe_pool.submit(_fetch_status, f"{base}/sitemap.xml", 5)
+        
         # Check site accessibility
         try:
-            response = requests.get(domain, timeout=10, allow_redirects=True)
+            response = _fetch_page(domain)
             results['is_accessible'] = response.status_code == 200
             results['status_code'] = response.status_code
         except Exception as e:
             return f"❌ **Technical Audit Failed**\n\nUnable to access {domain}: {str(e)}"
         
-        # Check robots.txt
-        try:
-            robots_url = f"{domain.rstrip('/')}/robots.txt"
-            robots_response = requests.get(robots_url, timeout=5)
-            results['has_robots_txt'] = robots_response.status_code == 200
-        except:
-            results['has_robots_txt'] = False
-        
-        # Check sitemap.xml
-        try:
-            sitemap_url = f"{domain.rstrip('/')}/sitemap.xml"
-            sitemap_response = requests.get(sitemap_url, timeout=5)
-            results['has_sitemap'] = sitemap_response.status_code == 200
-        except:
-            results['has_sitemap'] = False
-        
         # Parse homepage for basic checks
         try:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = _parse_html(response.content, _AUDIT_STRAINER)
             
             # Check title tag
             title = soup.find('title')
@@ -108,16 +419,26 @@ def audit_technical_seo(domain: str) -> dict:
             results['h1_count'] = len(h1_tags)
             
         except Exception as e:
-            logger.error(f"Error parsing HTML: {e}")
+            logger.error("Error parsing HTML: %r", e)
+        
+        # Collect the background checks (the homepage was parsed while they ran)
+        results['has_robots_txt'] = robots_future.result() is not None
+        results['has_sitemap'] = sitemap_future.result() == 200
+        
+        results['has_h1'] = results.get('h1_count', 0) >= 1
         
-        # Calculate score
+        # Score, check lines and priority issues in one pass over the check table
         score = 0
-        if results['has_ssl']: score += 20
-        if results['has_robots_txt']: score += 15
-        if results['has_sitemap']: score += 15
-        if results.get('has_title'): score += 20
-        if results.get('has_meta_description'): score += 15
-        if results.get('h1_count', 0) >= 1: score += 15
+        check_lines = []
+        priority_issues = []
+        for key, label, weight, passed_detail, failed_detail, issue in _AUDIT_CHECKS:
+            passed = bool(results.get(key))
+            if passed:
+                score += weight
+            elif issue:
+                priority_issues.append(issue)
+            detail = (passed_detail if passed else failed_detail).format(h1_count=results.get('h1_count', 0))
+            check_lines.append(f"{'✅' if passed else '❌'} **{label}:** {detail}")
         
         results['overall_score'] = score
         
@@ -130,28 +451,13 @@ def audit_technical_seo(domain: str) -> dict:
 
 ### Technical Checks
 
-{'✅' if results['has_ssl'] else '❌'} **HTTPS/SSL:** {'Enabled' if results['has_ssl'] else 'Not enabled - CRITICAL ISSUE'}
-{'✅' if results['has_robots_txt'] else '❌'} **robots.txt:** {'Found' if results['has_robots_txt'] else 'Missing'}
-{'✅' if results['has_sitemap'] else '❌'} **sitemap.xml:** {'Found' if results['has_sitemap'] else 'Missing'}
-{'✅' if results.get('has_title') else '❌'} **Title Tag:** {'Present' if results.get('has_title') else 'Missing'}
-{'✅' if results.get('has_meta_description') else '❌'} **Meta Description:** {'Present' if results.get('has_meta_description') else 'Missing'}
-{'✅' if results.get('h1_count', 0) >= 1 else '❌'} **H1 Tags:** {results.get('h1_count', 0)} found
+{chr(10).join(check_lines)}
 
 ### Priority Issues
 
 """
         
         # Add priority issues
-        priority_issues = []
-        if not results['has_ssl']:
-            priority_issues.append("🔴 **CRITICAL:** Enable HTTPS/SSL for security and SEO")
-        if not results['has_robots_txt']:
-            priority_issues.append("🟠 **HIGH:** Create robots.txt to guide search engine crawlers")
-        if not results['has_sitemap']:
-            priority_issues.append("🟠 **HIGH:** Create XML sitemap to help search engines index your site")
-        if not results.get('has_title'):
-            priority_issues.append("🔴 **CRITICAL:** Add title tag to homepage")
-        
         if priority_issues:
             for issue in priority_issues:
                 report += f"{issue}\n\n"
@@ -169,36 +475,37 @@ def audit_technical_seo(domain: str) -> dict:
         return report
         
     except Exception as e:
-        logger.error(f"Technical audit error: {e}", exc_info=True)
+        logger.error("Technical audit error: %r", e)
         return f"❌ **Technical Audit Failed**\n\nError: {str(e)}"
 
 
-def research_keywords(topic: str, domain: Optional[str] = None) -> str:
+def audit_technical_seo_bulk(domains: List[str], max_concurrent: int = 20) -> List[str]:
     """
-    Research keywords for a given topic.
+    Audit several domains concurrently.
     
     Args:
-        topic: Topic or niche to research
-        domain: Optional domain for context
+        domains: Domains to audit (e.g., ["example.com", "example.org"])
+        max_concurrent: Maximum number of audits in flight at once
         
     Returns:
-        Formatted text report of keyword research
+        Technical audit reports, in the same order as domains
     """
-    try:
-        logger.info(f"Researching keywords for topic: {topic}")
-        
-        # In a real implementation, you would:
-        # 1. Call keyword research APIs (SEMrush, Ahrefs, Google Keyword Planner)
-        # 2. Analyze search volumes
-        # 3. Check keyword difficulty
-        # 4. Identify search intent
-        
-        # For now, provide AI-generated strategic guidance
-        report = f"""🎯 **Keyword Research Complete**
+    if not domains:
+        return []
+    workers = max(1, min(max_concurrent, len(domains)))
+    # Dedicated pools: each audit waits on its own two probes, so the shared 8-worker
+    # _FETCH_POOL would throttle the audits; size the probe pool to keep up with them
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seo-audit") as pool, \
+            ThreadPoolExecutor(max_workers=2 * workers, thread_name_prefix="seo-probe") as probe_pool:
+        return list(pool.map(functools.partial(audit_technical_seo, probe_pool=probe_pool), domains))
+
+
+# Static keyword strategy guidance; only topic, domain and date vary per call
+_KEYWORD_REPORT_TEMPLATE = """🎯 **Keyword Research Complete**
 
 **Topic:** {topic}
-{f'**Domain:** {domain}' if domain else ''}
-**Research Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
+{domain_line}
+**Research Date:** {date}
 
 ### Keyword Strategy
 
@@ -247,91 +554,80 @@ These are 4+ word phrases with lower competition and higher conversion:
 4. **Content Creation:** Write 2-4 posts/month targeting keywords
 5. **Performance Tracking:** Set up Google Search Console
 """
+
+
+def research_keywords(topic: str, domain: Optional[str] = None) -> str:
+    """
+    Research keywords for a given topic.
+    
+    Args:
+        topic: Topic or niche to research
+        domain: Optional domain for context
+        
+    Returns:
+        Formatted text report of keyword research
+    """
+    try:
+        logger.info("Researching keywords for topic: %s", topic)
+        
+        # In a real implementation, you would:
+        # 1. Call keyword research APIs (SEMrush, Ahrefs, Google Keyword Planner)
+        # 2. Analyze search volumes
+        # 3. Check keyword difficulty
+        # 4. Identify search intent
+        
+        # For now, provide AI-generated strategic guidance
+        report = _KEYWORD_REPORT_TEMPLATE.format(
+            topic=topic,
+            domain_line=f'**Domain:** {domain}' if domain else '',
+            date=datetime.now().strftime('%Y-%m-%d %H:%M'),
+        )
         
         return report
         
     except Exception as e:
-        logger.error(f"Keyword research error: {e}", exc_info=True)
+        logger.error("Keyword research error: %r", e)
         return f"❌ **Keyword Research Failed**\n\nError: {str(e)}"
 
 
-def analyze_content(url: str) -> str:
+def extract_content_data(url: str) -> Dict[str, Any]:
     """
-    Analyze content quality and SEO optimization.
+    Fetch a page and extract its on-page SEO data.
     
     Args:
         url: URL to analyze
         
     Returns:
-        Formatted text report of content analysis
+        Dict with url, title, meta_description, h1s, word_count, score and
+        recommendations; on failure only url and error
     """
     try:
         # Validate URL
         is_valid, error = validate_url(url)
         if not is_valid:
-            return f"❌ **Content Analysis Failed**\n\nError: {error}"
+            return {'url': url, 'error': error}
         
-        logger.info(f"Analyzing content at {url}")
+        logger.info("Analyzing content at %s", url)
         
         # Fetch page
-        response = requests.get(url, timeout=10)
+        response = _fetch_page(url)
         if response.status_code != 200:
-            return f"❌ **Content Analysis Failed**\n\nUnable to access {url} (Status: {response.status_code})"
+            return {'url': url, 'error': f"Unable to access {url} (Status: {response.status_code})"}
+        if not response.content:
+            return {'url': url, 'error': f"{url} is not an HTML page (Content-Type: {response.content_type})"}
         
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract SEO elements
-        title = soup.find('title')
-        title_text = title.get_text() if title else None
-        
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        meta_desc_text = meta_desc.get('content') if meta_desc else None
-        
-        h1_tags = soup.find_all('h1')
-        h1_texts = [h1.get_text().strip() for h1 in h1_tags]
-        
-        # Get body text
-        for script in soup(['script', 'style']):
-            script.decompose()
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        words = [word for line in lines for word in line.split()]
-        word_count = len(words)
+        # Extract SEO elements and body word count
+        title_text, meta_desc_text, h1_texts, word_count = _content_elements(response.content, response.content_type)
         
         # Calculate content score
         score = 0
         if title_text: score += 20
         if meta_desc_text: score += 20
-        if len(h1_tags) == 1: score += 15  # Exactly one H1
+        if len(h1_texts) == 1: score += 15  # Exactly one H1
         if word_count >= 300: score += 20
         if word_count >= 1000: score += 10
         if meta_desc_text and 120 <= len(meta_desc_text) <= 160: score += 15
         
-        # Generate report
-        report = f"""📝 **Content Analysis Complete**
-
-**URL:** {url}
-**Analysis Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
-**Content Score:** {score}/100
-
-### SEO Elements
-
-**Title Tag:** {title_text if title_text else '❌ Missing'}
-{'✅' if title_text and 30 <= len(title_text) <= 60 else '⚠️'} Length: {len(title_text) if title_text else 0} chars (Optimal: 30-60)
-
-**Meta Description:** {meta_desc_text if meta_desc_text else '❌ Missing'}
-{'✅' if meta_desc_text and 120 <= len(meta_desc_text) <= 160 else '⚠️'} Length: {len(meta_desc_text) if meta_desc_text else 0} chars (Optimal: 120-160)
-
-**H1 Tags:** {len(h1_tags)} found {'✅' if len(h1_tags) == 1 else '⚠️ Should have exactly 1'}
-{chr(10).join(f'- {h1}' for h1 in h1_texts[:3])}
-
-**Word Count:** {word_count} words {'✅' if word_count >= 300 else '⚠️ Minimum 300 words recommended'}
-
-### Recommendations
-
-"""
-        
         # Add specific recommendations
         recommendations = []
         if not title_text:
@@ -344,21 +640,77 @@ def analyze_content(url: str) -> str:
         elif len(meta_desc_text) < 120 or len(meta_desc_text) > 160:
             recommendations.append(f"🟠 **Meta Description:** Current length is {len(meta_desc_text)} chars. Aim for 120-160 characters.")
         
-        if len(h1_tags) == 0:
+        if len(h1_texts) == 0:
             recommendations.append("🔴 **CRITICAL:** Add an H1 tag to define the page topic")
-        elif len(h1_tags) > 1:
-            recommendations.append(f"🟡 **H1 Structure:** You have {len(h1_tags)} H1 tags. Use only ONE H1 per page.")
+        elif len(h1_texts) > 1:
+            recommendations.append(f"🟡 **H1 Structure:** You have {len(h1_texts)} H1 tags. Use only ONE H1 per page.")
         
         if word_count < 300:
             recommendations.append(f"🟠 **Content Length:** Add more content. Current: {word_count} words, Minimum: 300 words")
         
-        if not recommendations:
-            recommendations.append("✅ No critical issues found! This page follows SEO best practices.")
+        return {
+            'url': url,
+            'title': title_text,
+            'meta_description': meta_desc_text,
+            'h1s': h1_texts,
+            'word_count': word_count,
+            'score': score,
+            'recommendations': recommendations,
+        }
         
-        for rec in recommendations:
-            report += f"{rec}\n\n"
+    except Exception as e:
+        logger.error("Content analysis error: %r", e)
+        return {'url': url, 'error': str(e)}
+
+
+def analyze_content(url: str) -> str:
+    """
+    Analyze content quality and SEO optimization.
+    
+    Args:
+        url: URL to analyze
         
-        report += """### Next Steps
+    Returns:
+        Formatted text report of content analysis
+    """
+    data = extract_content_data(url)
+    if 'error' in data:
+        return f"❌ **Content Analysis Failed**\n\nError: {data['error']}"
+    
+    title_text = data['title']
+    meta_desc_text = data['meta_description']
+    h1_texts = data['h1s']
+    word_count = data['word_count']
+    
+    # Generate report
+    report = f"""📝 **Content Analysis Complete**
+
+**URL:** {url}
+**Analysis Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
+**Content Score:** {data['score']}/100
+
+### SEO Elements
+
+**Title Tag:** {title_text if title_text else '❌ Missing'}
+{'✅' if title_text and 30 <= len(title_text) <= 60 else '⚠️'} Length: {len(title_text) if title_text else 0} chars (Optimal: 30-60)
+
+**Meta Description:** {meta_desc_text if meta_desc_text else '❌ Missing'}
+{'✅' if meta_desc_text and 120 <= len(meta_desc_text) <= 160 else '⚠️'} Length: {len(meta_desc_text) if meta_desc_text else 0} chars (Optimal: 120-160)
+
+**H1 Tags:** {len(h1_texts)} found {'✅' if len(h1_texts) == 1 else '⚠️ Should have exactly 1'}
+{chr(10).join(f'- {h1}' for h1 in h1_texts[:3])}
+
+**Word Count:** {word_count} words {'✅' if word_count >= 300 else '⚠️ Minimum 300 words recommended'}
+
+### Recommendations
+
+"""
+    
+    recommendations = data['recommendations'] or ["✅ No critical issues found! This page follows SEO best practices."]
+    for rec in recommendations:
+        report += f"{rec}\n\n"
+    
+    report += """### Next Steps
 
 1. **Implement Fixes:** Address priority issues first (marked with 🔴)
 2. **Add Keywords:** Incorporate target keywords naturally in title, headings, and content
@@ -366,40 +718,21 @@ def analyze_content(url: str) -> str:
 4. **Add Internal Links:** Link to 3-5 related pages on your site
 5. **Add Media:** Include relevant images, videos, or infographics
 """
-        
-        return report
-        
-    except Exception as e:
-        logger.error(f"Content analysis error: {e}", exc_info=True)
-        return f"❌ **Content Analysis Failed**\n\nError: {str(e)}"
+    
+    return report
 
 
-def check_performance(domain: str, metric_type: str = "all") -> str:
-    """
-    Check website performance and rankings.
-    
-    Args:
-        domain: Domain to check
-        metric_type: Type of metrics to check ('all', 'rankings', 'traffic', 'speed')
-    
-    Returns:
-        Formatted text report of performance metrics
-    """
-    try:
-        logger.info(f"Checking performance for {domain} - Metrics: {metric_type}")
-        
-        # Build report based on metric_type
-        report = f"""📊 **Performance Monitoring Report**
+_PERFORMANCE_HEADER_TEMPLATE = """📊 **Performance Monitoring Report**
 
 **Domain:** {domain}
-**Report Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
-**Metrics Type:** {metric_type.upper()}
+**Report Date:** {date}
+**Metrics Type:** {metric_type}
 
 """
-        
-        # Include sections based on metric_type
-        if metric_type in ["all", "rankings"]:
-            report += """### Keyword Rankings
+
+# (metric_type, section) in report order; "all"-only sections are keyed "all"
+_PERFORMANCE_SECTIONS = (
+    ("rankings", """### Keyword Rankings
 
 **Note:** Connect your Google Search Console account for real-time ranking data.
 
@@ -415,10 +748,8 @@ def check_performance(domain: str, metric_type: str = "all") -> str:
 - Track competitor rankings
 - Focus on page 2 keywords (easier wins)
 
-"""
-
-        if metric_type in ["all", "traffic"]:
-            report += """### Organic Traffic
+"""),
+    ("traffic", """### Organic Traffic
 
 **Connect Google Analytics 4 for:**
 - Monthly visitor count
@@ -433,10 +764,8 @@ def check_performance(domain: str, metric_type: str = "all") -> str:
 - Pages per session
 - Goal completions
 
-"""
-
-        if metric_type in ["all", "speed"]:
-            report += """### Page Speed & Core Web Vitals
+"""),
+    ("speed", """### Page Speed & Core Web Vitals
 
 **Test your site speed at:**
 - PageSpeed Insights (pagespeed.web.dev)
@@ -455,10 +784,8 @@ def check_performance(domain: str, metric_type: str = "all") -> str:
 4. Use a CDN
 5. Optimize server response time
 
-"""
-
-        if metric_type == "all":
-            report += """### Recommended Tools
+"""),
+    ("all", """### Recommended Tools
 
 1. **Google Search Console** (Free) - PRIORITY 1
    - Set up at search.google.com/search-console
@@ -485,33 +812,54 @@ def check_performance(domain: str, metric_type: str = "all") -> str:
 4. ✅ **Fix technical issues** - Run technical audit
 5. ✅ **Monitor weekly** - Check metrics every Monday
 
-"""
-        
-        return report
-        
-    except Exception as e:
-        logger.error(f"Performance check error: {e}", exc_info=True)
-        return f"❌ **Performance Check Failed**\n\nError: {str(e)}"
-
+"""),
+)
 
 
-def generate_seo_report(domain: str) -> str:
+def check_performance(domain: str, metric_type: str = "all") -> str:
     """
-    Generate comprehensive SEO report.
+    Check website performance and rankings.
     
     Args:
-        domain: Domain to report on
-        
+        domain: Domain to check
+        metric_type: Type of metrics to check ('all', 'rankings', 'traffic', 'speed')
+    
     Returns:
-        Formatted comprehensive SEO report
+        Formatted text report of performance metrics
     """
     try:
-        logger.info(f"Generating comprehensive report for {domain}")
+        logger.info("Checking performance for %s - Metrics: %s", domain, metric_type)
+        
+        # Build report based on metric_type
+        report = _PERFORMANCE_HEADER_TEMPLATE.format(
+            domain=domain,
+            date=datetime.now().strftime('%Y-%m-%d %H:%M'),
+            metric_type=metric_type.upper(),
+        )
+        
+        # Include sections based on metric_type ("all" gets every section)
+        report += "".join(text for key, text in _PERFORMANCE_SECTIONS if metric_type in ("all", key))
+        
+        return report
         
-        report = f"""📋 **Comprehensive SEO Report**
+    except Exception as e:
+        logger.error("Performance check error: %r", e)
+        return f"❌ **Performance Check Failed**\n\nError: {str(e)}"
+
+
+
+_CONTENT_HINT_TEMPLATE = """Run `analyze content at {domain}` for page-level optimization including:
+- Title tag and meta description optimization
+- Heading structure (H1-H6)
+- Content length and quality
+- Keyword usage
+- Internal linking"""
+
+# Comprehensive report skeleton; only domain, date and the content section vary per call
+_SEO_REPORT_TEMPLATE = """📋 **Comprehensive SEO Report**
 
 **Domain:** {domain}
-**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
+**Report Generated:** {date}
 
 ---
 
@@ -530,12 +878,7 @@ Run `audit {domain}` for detailed technical analysis including:
 
 ## 2. Content Strategy
 
-Run `analyze content at {domain}` for page-level optimization including:
-- Title tag and meta description optimization
-- Heading structure (H1-H6)
-- Content length and quality
-- Keyword usage
-- Internal linking
+{content_section}
 
 ## 3. Keyword Opportunities
 
@@ -602,9 +945,45 @@ Run `check rankings for {domain}` to monitor:
 
 **Next Step:** Run specific commands above for detailed analysis of each area.
 """
+
+
+def generate_seo_report(domain: str, content_data: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Generate comprehensive SEO report.
+    
+    Args:
+        domain: Domain to report on
+        content_data: Optional output of extract_content_data() for the
+            homepage; when given, the content section is built from it
+        
+    Returns:
+        Formatted comprehensive SEO report
+    """
+    try:
+        logger.info("Generating comprehensive report for %s", domain)
+        
+        if content_data and 'error' not in content_data:
+            meta_desc = content_data['meta_description']
+            issues = content_data['recommendations'] or ["✅ No critical issues found"]
+            content_section = f"""**Content Score:** {content_data['score']}/100 ({content_data['url']})
+
+- **Title Tag:** {content_data['title'] or '❌ Missing'}
+- **Meta Description:** {f'{len(meta_desc)} chars' if meta_desc else '❌ Missing'}
+- **H1 Tags:** {len(content_data['h1s'])} found
+- **Word Count:** {content_data['word_count']} words
+
+{chr(10).join(f'- {issue}' for issue in issues)}"""
+        else:
+            content_section = _CONTENT_HINT_TEMPLATE.format(domain=domain)
+        
+        report = _SEO_REPORT_TEMPLATE.format(
+            domain=domain,
+            date=datetime.now().strftime('%Y-%m-%d %H:%M'),
+            content_section=content_section,
+        )
         
         return report
         
     except Exception as e:
-        logger.error(f"Report generation error: {e}", exc_info=True)
+        logger.error("Report generation error: %r", e)
         return f"❌ **Report Generation Failed**\n\nError: {str(e)}"